@@ -2,10 +2,14 @@
 rumdl: An extremely fast Markdown linter written in Rust.
 """
 
-try:
-    from importlib.metadata import version
-    __version__ = version("rumdl")
-except ImportError:
-    # Python < 3.8
-    from importlib_metadata import version
-    __version__ = version("rumdl")
+
+def __getattr__(name: str) -> str:
+    # Resolved on first access rather than at import: looking up package
+    # metadata scans sys.path, and `python -m rumdl` imports this module on
+    # every run without needing the version.
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = value = version("rumdl")
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
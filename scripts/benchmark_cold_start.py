@@ -9,6 +9,7 @@ All tools run via npx/uvx or pre-built binaries — no global installs required.
 """
 
 import argparse
+import functools
 import os
 import platform
 import subprocess
@@ -76,20 +77,35 @@ MADO_VERSION = "v0.3.0"
 MADO_TOOLS_DIR = Path("benchmark/.tools")
 
 
+def _probe(*commands):
+    """Run `<command> --version` for all commands at once. Returns name -> succeeded."""
+    procs = {}
+    for cmd in commands:
+        try:
+            procs[cmd] = subprocess.Popen(
+                [cmd, "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            pass
+    return {cmd: cmd in procs and procs[cmd].wait() == 0 for cmd in commands}
+
+
+@functools.cache
+def _available_commands():
+    """Probe every external command the benchmark relies on, once and concurrently.
+
+    Several tools share a runner (five go through npx), so probing per tool
+    would start the same slow `npx --version` over and over.
+    """
+    return _probe("hyperfine", "npx", "uvx")
+
+
 def _has_npx():
-    try:
-        subprocess.run(["npx", "--version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return _available_commands()["npx"]
 
 
 def _has_uvx():
-    try:
-        subprocess.run(["uvx", "--version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return _available_commands()["uvx"]
 
 
 def _mado_bin_path():
@@ -164,12 +180,10 @@ def _ensure_mado():
 
 def check_hyperfine():
     """Check if hyperfine is installed."""
-    try:
-        subprocess.run(["hyperfine", "--version"], capture_output=True, check=True)
+    if _available_commands()["hyperfine"]:
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ hyperfine not found. Install it with: brew install hyperfine")
-        return False
+    print("❌ hyperfine not found. Install it with: brew install hyperfine")
+    return False
 
 
 def discover_tools(selected=None):
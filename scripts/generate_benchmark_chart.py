@@ -6,6 +6,7 @@ Creates a transparent SVG chart that works in both light and dark modes,
 following ruff's minimalistic design principles.
 """
 
+import io
 import json
 import re
 import sys
@@ -27,6 +28,10 @@ def generate_chart():
 
     # Import matplotlib here to provide better error message
     try:
+        import matplotlib
+
+        # Only ever writes files; skip probing for a GUI toolkit
+        matplotlib.use("Agg")
         import matplotlib.pyplot as plt
     except ImportError:
         print("❌ matplotlib not found")
@@ -113,28 +118,25 @@ def generate_chart():
 
     plt.tight_layout()
 
-    # Save as SVG to assets/
-    output_path = Path("assets/benchmark.svg")
+    # Render once; the same SVG goes to assets/ and benchmark/results/
+    svg = io.BytesIO()
     plt.savefig(
-        output_path,
+        svg,
         bbox_inches="tight",
         facecolor="none",
         transparent=True,
         pad_inches=0.2,
         format="svg",
     )
+    svg_bytes = svg.getvalue()
+
+    output_path = Path("assets/benchmark.svg")
+    output_path.write_bytes(svg_bytes)
     print(f"✅ Chart saved to {output_path}")
 
     # Also save to benchmark/results/ for reference
     intermediate_path = Path("benchmark/results/cold_start_comparison.svg")
-    plt.savefig(
-        intermediate_path,
-        bbox_inches="tight",
-        facecolor="none",
-        transparent=True,
-        pad_inches=0.2,
-        format="svg",
-    )
+    intermediate_path.write_bytes(svg_bytes)
     print(f"✅ Intermediate chart saved to {intermediate_path}")
 
 
@@ -13,21 +13,30 @@ import json
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 MIN_STARS = 500
 KNOWN_REPOS_MARKER = "## Used By"
+# GitHub repo URLs, e.g. in the Used By section. Owner and name are limited to
+# the characters GitHub allows, so a match cannot run past the end of a link.
+GITHUB_REPO_URL = re.compile(r"github\.com/([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)")
+# Repos per GraphQL star lookup
+STARS_BATCH_SIZE = 100
 
 
-def run_gh(args: list[str]) -> str:
-    """Run a gh CLI command and return output."""
+def run_gh(args: list[str], check: bool = True) -> str:
+    """Run a gh CLI command and return output.
+
+    With check=False, output is returned even if gh exits non-zero.
+    """
     result = subprocess.run(
         ["gh", *args],
         capture_output=True,
         text=True,
         timeout=30,
     )
-    return result.stdout if result.returncode == 0 else ""
+    return result.stdout if result.returncode == 0 or not check else ""
 
 
 def get_known_repos() -> set[str]:
@@ -37,9 +46,7 @@ def get_known_repos() -> set[str]:
         return set()
 
     content = readme.read_text()
-    # Match GitHub repo URLs in the Used By section
-    pattern = r"github\.com/([^/]+/[^/)]+)"
-    return set(re.findall(pattern, content))
+    return set(GITHUB_REPO_URL.findall(content))
 
 
 def search_repos() -> set[str]:
@@ -52,27 +59,53 @@ def search_repos() -> set[str]:
         ["search", "code", "rumdl", "--filename", ".pre-commit-config.yml", "--json", "repository", "--limit", "100"],
     ]
 
-    for args in searches:
+    def search(args: list[str]) -> str:
+        try:
+            return run_gh(args)
+        except subprocess.TimeoutExpired:
+            return ""
+
+    # The searches are independent network round-trips, so run them at once.
+    with ThreadPoolExecutor(max_workers=len(searches)) as pool:
+        outputs = list(pool.map(search, searches))
+
+    for output in outputs:
         try:
-            output = run_gh(args)
             if output:
                 for item in json.loads(output):
                     repo = item.get("repository", {}).get("nameWithOwner", "")
                     if repo and not repo.startswith("rvben/"):
                         repos.add(repo)
-        except (json.JSONDecodeError, subprocess.TimeoutExpired):
+        except json.JSONDecodeError:
             continue
 
     return repos
 
 
-def get_stars(repo: str) -> int:
-    """Get star count for a repo."""
-    try:
-        output = run_gh(["api", f"repos/{repo}", "--jq", ".stargazers_count"])
-        return int(output.strip()) if output.strip() else 0
-    except (ValueError, subprocess.TimeoutExpired):
-        return 0
+def get_stars(repos: list[str]) -> dict[str, int]:
+    """Get star counts for repos, batched into GraphQL requests."""
+    stars = {}
+    for start in range(0, len(repos), STARS_BATCH_SIZE):
+        batch = repos[start : start + STARS_BATCH_SIZE]
+        fields = []
+        for i, repo in enumerate(batch):
+            owner, name = repo.split("/", 1)
+            fields.append(
+                f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+                "{ stargazerCount }"
+            )
+        query = "query { " + " ".join(fields) + " }"
+        try:
+            # A deleted or private repo makes gh exit non-zero, but the
+            # response still carries the stars for every other repo.
+            output = run_gh(["api", "graphql", "-f", f"query={query}"], check=False)
+            data = (json.loads(output).get("data") or {}) if output else {}
+        except (json.JSONDecodeError, subprocess.TimeoutExpired):
+            data = {}
+        for i, repo in enumerate(batch):
+            node = data.get(f"r{i}")
+            stars[repo] = node["stargazerCount"] if node else 0
+    return stars
 
 
 def main():
@@ -85,11 +118,11 @@ def main():
     print(f"   Found {len(repos)} repos referencing rumdl")
 
     # Check stars for repos not already known
+    candidates = sorted(repos - known)
+    all_stars = get_stars(candidates)
     new_notable = []
-    for repo in sorted(repos):
-        if repo in known:
-            continue
-        stars = get_stars(repo)
+    for repo in candidates:
+        stars = all_stars[repo]
         if stars >= MIN_STARS:
             new_notable.append((repo, stars))
             print(f"   ⭐ NEW: {repo} ({stars:,} stars)")